@@ -5,8 +5,19 @@ withdrawal, account deletion, and saving/loading the account data to/from a JSON
 """
 
 import threading
+import heapq
 import json
 import os
+import time
+from array import array
+from contextlib import contextmanager
+
+SHARDS = 16  # number of lock stripes over the account balances
+SAVE_INTERVAL = 1.0  # seconds between background saves of changed data
+FIRST_ACCOUNT = 10000  # lowest account number
+LAST_ACCOUNT = 99999  # highest account number
+NO_ACCOUNT = -1  # balance slot value of an account number that is not in use
+MAX_BALANCE = 9223372036854775807  # largest balance a slot can hold (signed 64-bit)
 
 
 class Bank:
@@ -14,14 +25,73 @@ class Bank:
         """
         Initializes the Bank instance.
 
+        Balances are kept in a preallocated array with one 64-bit slot per possible account number.
+        The slots are striped across several locks by account number, so operations on accounts
+        in different stripes do not contend.
+
         Args:
             bank_code (str): Unique identifier for the bank (typically the local IP address).
         """
         self.bank_code = bank_code
-        self.accounts = {}  # key: account number (int), value: current balance
-        self.account_lock = threading.Lock()
-        self.next_account_number = 10000  # initial account number
-        self.free_accounts = []  # list of recycled account numbers
+        self.bank_code_bytes = bank_code.encode("utf-8")  # bank code as used in byte replies
+        self.bc_response = b"BC " + self.bank_code_bytes + b"\r\n"  # precomputed reply of the BC command
+        self.local_suffix = "/" + bank_code  # ending of the account arguments of local accounts
+        # Slot i holds the balance of account FIRST_ACCOUNT + i, or NO_ACCOUNT.
+        self.balances = array("q", [NO_ACCOUNT]) * (LAST_ACCOUNT - FIRST_ACCOUNT + 1)
+        self.shard_locks = [threading.Lock() for _ in range(SHARDS)]
+        self.shard_totals = [0] * SHARDS  # running sum of the balances in each stripe
+        # Guards account number allocation. Always acquired before any shard lock.
+        self.allocator_lock = threading.Lock()
+        self.next_account_number = FIRST_ACCOUNT  # initial account number
+        self.free_accounts = []  # min-heap of recycled account numbers
+        self.client_count = 0  # number of active accounts, guarded by allocator_lock
+        self.dirty = False  # True when there are changes not yet saved to the file
+        self.save_lock = threading.Lock()  # serializes writes of the data file
+        self.save_error = None  # message of the last failed background save, reported only once
+
+    def _shard(self, account_number):
+        """
+        Returns the index of the lock stripe covering the given account number.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            int: The shard index.
+        """
+        return account_number % SHARDS
+
+    def _slot(self, account_number):
+        """
+        Returns the index of the balance slot of an existing account.
+
+        Must be called with the account's shard lock held.
+
+        Args:
+            account_number (int): The account number.
+
+        Returns:
+            int: The slot index, or None if the account does not exist.
+        """
+        if not FIRST_ACCOUNT <= account_number <= LAST_ACCOUNT:
+            return None
+        index = account_number - FIRST_ACCOUNT
+        if self.balances[index] == NO_ACCOUNT:
+            return None
+        return index
+
+    @contextmanager
+    def _all_shards_locked(self):
+        """
+        Acquires all shard locks in index order for a consistent view of every account.
+        """
+        for lock in self.shard_locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self.shard_locks):
+                lock.release()
 
     def create_account(self):
         """
@@ -33,16 +103,19 @@ class Bank:
         Raises:
             Exception: If no new account can be created.
         """
-        with self.account_lock:
+        with self.allocator_lock:
             if self.free_accounts:
                 # Recycle the smallest available account number.
-                account_number = self.free_accounts.pop(0)
+                account_number = heapq.heappop(self.free_accounts)
             else:
-                if self.next_account_number > 99999:
+                if self.next_account_number > LAST_ACCOUNT:
                     raise Exception("OUR BANK DOES NOT ALLOW NEW ACCOUNT CREATION.")
                 account_number = self.next_account_number
                 self.next_account_number += 1
-            self.accounts[account_number] = 0
+            with self.shard_locks[self._shard(account_number)]:
+                self.balances[account_number - FIRST_ACCOUNT] = 0
+            self.client_count += 1
+            self.dirty = True
         return account_number
 
     def deposit(self, account_number, amount):
@@ -54,12 +127,19 @@ class Bank:
             amount (int): The amount to deposit.
 
         Raises:
-            Exception: If the account number is not valid.
+            Exception: If the account number is not valid or the balance would exceed MAX_BALANCE.
         """
-        with self.account_lock:
-            if account_number not in self.accounts:
+        shard = self._shard(account_number)
+        with self.shard_locks[shard]:
+            index = self._slot(account_number)
+            if index is None:
+                raise Exception("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
+            balance = self.balances[index] + amount
+            if balance > MAX_BALANCE:
                 raise Exception("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-            self.accounts[account_number] += amount
+            self.balances[index] = balance
+            self.shard_totals[shard] += amount
+            self.dirty = True
 
     def withdraw(self, account_number, amount):
         """
@@ -72,12 +152,16 @@ class Bank:
         Raises:
             Exception: If the account number is not valid or funds are insufficient.
         """
-        with self.account_lock:
-            if account_number not in self.accounts:
+        shard = self._shard(account_number)
+        with self.shard_locks[shard]:
+            index = self._slot(account_number)
+            if index is None:
                 raise Exception("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-            if self.accounts[account_number] < amount:
+            if self.balances[index] < amount:
                 raise Exception("INSUFFICIENT FUNDS")
-            self.accounts[account_number] -= amount
+            self.balances[index] -= amount
+            self.shard_totals[shard] -= amount
+            self.dirty = True
 
     def get_balance(self, account_number):
         """
@@ -92,10 +176,11 @@ class Bank:
         Raises:
             Exception: If the account number is not found.
         """
-        with self.account_lock:
-            if account_number not in self.accounts:
+        with self.shard_locks[self._shard(account_number)]:
+            index = self._slot(account_number)
+            if index is None:
                 raise Exception("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-            return self.accounts[account_number]
+            return self.balances[index]
 
     def remove_account(self, account_number):
         """
@@ -107,15 +192,17 @@ class Bank:
         Raises:
             Exception: If the account is not found or contains funds.
         """
-        with self.account_lock:
-            if account_number not in self.accounts:
+        with self.allocator_lock, self.shard_locks[self._shard(account_number)]:
+            index = self._slot(account_number)
+            if index is None:
                 raise Exception("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-            if self.accounts[account_number] != 0:
+            if self.balances[index] != 0:
                 raise Exception("CANNOT DELETE AN ACCOUNT THAT HAS FUNDS.")
-            del self.accounts[account_number]
+            self.balances[index] = NO_ACCOUNT
             # Recycle the account number for future use.
-            self.free_accounts.append(account_number)
-            self.free_accounts.sort()
+            heapq.heappush(self.free_accounts, account_number)
+            self.client_count -= 1
+            self.dirty = True
 
     def get_total_amount(self):
         """
@@ -124,8 +211,8 @@ class Bank:
         Returns:
             int: Total amount of funds in the bank.
         """
-        with self.account_lock:
-            return sum(self.accounts.values())
+        with self._all_shards_locked():
+            return sum(self.shard_totals)
 
     def get_client_count(self):
         """
@@ -134,43 +221,130 @@ class Bank:
         Returns:
             int: The count of accounts.
         """
-        with self.account_lock:
-            return len(self.accounts)
+        with self.allocator_lock:
+            return self.client_count
 
     def save_data(self, file_name="accounts.json"):
         """
         Saves the current bank data (accounts, free accounts, next account number) to a JSON file atomically.
 
         The data is first written to a temporary file, which is then atomically replaced to ensure consistency.
+        The locks are held only while the used part of the balance array is copied; the accounts are then
+        streamed into the file from the copy.
 
         Args:
             file_name (str): The name of the file to save the data.
         """
-        with self.account_lock:
-            data = {
-                "accounts": self.accounts,
-                "free_accounts": self.free_accounts,
-                "next_account_number": self.next_account_number
-            }
-        temp_file = file_name + ".tmp"
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        os.replace(temp_file, file_name)  # Atomic replace
+        with self.save_lock:
+            with self.allocator_lock, self._all_shards_locked():
+                # Slots at or above next_account_number have never been used.
+                balances = self.balances[:self.next_account_number - FIRST_ACCOUNT]
+                free_accounts = json.dumps(self.free_accounts, separators=(",", ":"))
+                next_account_number = self.next_account_number
+                self.dirty = False
+            temp_file = file_name + ".tmp"
+            try:
+                with open(temp_file, "w", encoding="utf-8") as f:
+                    f.write('{"accounts":{')
+                    separator = ""
+                    for index, balance in enumerate(balances):
+                        if balance != NO_ACCOUNT:
+                            f.write(f'{separator}"{FIRST_ACCOUNT + index}":{balance}')
+                            separator = ","
+                    f.write(f'}},"free_accounts":{free_accounts},"next_account_number":{next_account_number}}}')
+                os.replace(temp_file, file_name)  # Atomic replace
+            except Exception:
+                self.dirty = True  # Retry on the next save.
+                raise
 
     def load_data(self, file_name="accounts.json"):
         """
         Loads bank data from a JSON file, if it exists.
 
+        A file that exists but cannot be loaded is never replaced by an empty bank: the error is
+        raised instead, so the server does not start and later overwrite the file.
+
         Args:
             file_name (str): The name of the file from which to load the data.
+
+        Raises:
+            ValueError: If the file cannot be read or parsed, holds an account number or balance
+                out of range (balances must be integers from 0 to MAX_BALANCE), or its account numbers,
+                free numbers and next account number do not fit together.
         """
-        if os.path.exists(file_name):
-            try:
-                with open(file_name, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.accounts = {int(k): v for k, v in data.get("accounts", {}).items()}
-                    self.free_accounts = sorted([int(x) for x in data.get("free_accounts", [])])
-                    self.next_account_number = data.get("next_account_number", 10000)
-            except Exception:
-                # If loading fails, keep default values.
-                pass
+        if not os.path.exists(file_name):
+            return
+        try:
+            # Read the raw bytes in one call and let json.loads decode them,
+            # instead of going through a text-mode reader.
+            with open(file_name, "rb") as f:
+                raw = f.read()
+            data = json.loads(raw)
+            balances = array("q", [NO_ACCOUNT]) * (LAST_ACCOUNT - FIRST_ACCOUNT + 1)
+            shard_totals = [0] * SHARDS
+            client_count = 0
+            highest_account = FIRST_ACCOUNT - 1
+            for k, v in data.get("accounts", {}).items():
+                account_number = int(k)
+                if not FIRST_ACCOUNT <= account_number <= LAST_ACCOUNT:
+                    raise ValueError(f"account number {k} is out of range")
+                if type(v) is not int or not 0 <= v <= MAX_BALANCE:
+                    raise ValueError(f"balance of account {k} is not an integer from 0 to {MAX_BALANCE}")
+                if balances[account_number - FIRST_ACCOUNT] != NO_ACCOUNT:
+                    raise ValueError(f"account number {k} is listed more than once")
+                balances[account_number - FIRST_ACCOUNT] = v
+                shard_totals[self._shard(account_number)] += v
+                client_count += 1
+                highest_account = max(highest_account, account_number)
+            if "next_account_number" in data:
+                next_account_number = int(data["next_account_number"])
+            else:
+                # Continue after the highest account, so no listed account is ever handed out again.
+                next_account_number = highest_account + 1
+            # Only the slots below next_account_number are saved, so every account has to lie below it.
+            if not FIRST_ACCOUNT <= next_account_number <= LAST_ACCOUNT + 1:
+                raise ValueError(f"next account number {next_account_number} is out of range")
+            if highest_account >= next_account_number:
+                raise ValueError(f"account {highest_account} is not below the next account number")
+            free_accounts = [int(x) for x in data.get("free_accounts", [])]
+            if len(set(free_accounts)) != len(free_accounts):
+                raise ValueError("a free account number is listed more than once")
+            for account_number in free_accounts:
+                if not FIRST_ACCOUNT <= account_number < next_account_number:
+                    raise ValueError(f"free account number {account_number} is out of range")
+                if balances[account_number - FIRST_ACCOUNT] != NO_ACCOUNT:
+                    raise ValueError(f"free account number {account_number} is in use")
+        except Exception as e:
+            raise ValueError(f"cannot load {file_name}: {e}") from e
+        heapq.heapify(free_accounts)
+        self.balances = balances
+        self.shard_totals = shard_totals
+        self.client_count = client_count
+        self.free_accounts = free_accounts
+        self.next_account_number = next_account_number
+
+    def start_autosave(self, interval=SAVE_INTERVAL, file_name="accounts.json"):
+        """
+        Starts a background daemon thread that saves the bank data whenever it has changed.
+
+        Changes are written at most once per interval instead of after every operation.
+
+        Args:
+            interval (float): Number of seconds between checks for unsaved changes.
+            file_name (str): The name of the file to save the data.
+        """
+        def autosave():
+            while True:
+                time.sleep(interval)
+                if self.dirty:
+                    try:
+                        self.save_data(file_name)
+                        self.save_error = None
+                    except Exception as e:
+                        # The data stays dirty and the save is retried on the next tick.
+                        # The error is reported once, not on every retry.
+                        if str(e) != self.save_error:
+                            self.save_error = str(e)
+                            print(f"Error saving account data: {e}")
+
+        threading.Thread(target=autosave, daemon=True).start()
@@ -1,12 +1,23 @@
 """
-This module implements the bank commands using the Command Pattern and provides a proxy mechanism
-to forward commands (AD, AW, AB) to a remote node if the specified bank code (IP) does not match
-the local bank code. It also defines the BankServer class which handles client connections.
+This module implements the bank commands as plain functions dispatched through a command table
+and provides a proxy mechanism to forward commands (AD, AW, AB) to a remote node if the specified
+bank code (IP) does not match the local bank code. It also defines the BankServer class which
+handles client connections.
 """
 
-import concurrent.futures
+import asyncio
 import ipaddress
+import re
 import socket
+from functools import lru_cache
+
+from bank import FIRST_ACCOUNT, LAST_ACCOUNT, MAX_BALANCE
+
+RECV_SIZE = 65536  # number of bytes requested from a client connection per read
+MAX_COMMAND_LENGTH = 65536  # longest accepted command line; a client exceeding it is disconnected
+PROXY_TIMEOUT = 3  # seconds allowed for connecting to and reading from a remote bank
+PROXY_POOL_SIZE = 8  # idle connections kept open per remote bank
+MAX_PROXY_REQUESTS = 64  # forwarded commands allowed to be in progress at the same time
 
 
 # --- Exception and validation functions ---
@@ -17,9 +28,11 @@ class CommandError(Exception):
     pass
 
 
+@lru_cache(maxsize=1024)
 def validate_ip(ip_str):
     """
     Validates an IP address string.
+    Results are cached, since the same few bank codes are validated over and over.
 
     Args:
         ip_str (str): The IP address to validate.
@@ -34,36 +47,101 @@ def validate_ip(ip_str):
         return False
 
 
-def validate_account_number(account_num):
+# Precompiled pattern for amount arguments.
+AMOUNT_RE = re.compile(r"\A[0-9]+\Z")
+
+# Constant replies of successful commands.
+HELP_BYTES = (
+    b"Available Commands:\r\n"
+    b"BC - returns bank code\r\n"
+    b"AC - creates an account and returns its number\r\n"
+    b"AD - adds money to account\r\n"
+    b"AW - withdraws money from account\r\n"
+    b"AB - returns account balance\r\n"
+    b"AR - deletes account if empty\r\n"
+    b"BA - returns bank value\r\n"
+    b"BN - returns number of clients in bank\r\n"
+    b"\r\n"
+)
+AD_OK = b"AD\r\n"
+AW_OK = b"AW\r\n"
+AR_OK = b"AR\r\n"
+
+
+def set_socket_options(writer):
     """
-    Checks if the account number is within the allowed range.
+    Disables Nagle's algorithm and enables TCP keepalive on the socket of a stream.
+    Commands and responses are short lines, so they should be sent without waiting for more data.
 
     Args:
-        account_num (int): The account number to validate.
+        writer (asyncio.StreamWriter): The writer of the connection.
+    """
+    sock = writer.get_extra_info("socket")
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    except OSError:
+        pass
+
+
+# --- Proxy functionality ---
+# Idle connections to remote banks, keyed by (remote_ip, port), reused by later proxied commands.
+proxy_pool = {}
+# Bounds the forwarded commands in progress, so a burst of them cannot use up the file descriptors.
+proxy_slots = asyncio.BoundedSemaphore(MAX_PROXY_REQUESTS)
+
+
+async def _proxy_send(writer, command):
+    """
+    Sends one command over an open proxy connection.
+    """
+    writer.write((command + "\r\n").encode("utf-8"))
+    await writer.drain()
+
+
+async def _proxy_read(reader):
+    """
+    Reads the response line to a command sent over a proxy connection.
 
     Returns:
-        bool: True if valid, otherwise False.
+        bytes: The data received up to and including CRLF, or less if the remote closed the connection.
     """
-    return 10000 <= account_num <= 99999
+    response = b""
+    while not response.endswith(b"\r\n"):
+        data = await asyncio.wait_for(reader.read(1024), PROXY_TIMEOUT)
+        if not data:
+            break
+        response += data
+    return response
 
 
-def validate_number(number):
+async def proxy_command(remote_ip, command, port):
     """
-    Checks if a number is within the allowed range.
+    Forwards a command to a remote IP on the specified port.
+    If MAX_PROXY_REQUESTS forwarded commands are already in progress, the command fails immediately
+    instead of waiting for a free slot.
 
     Args:
-        number (int): The number to validate.
+        remote_ip (str): The remote IP address.
+        command (str): The command string to forward.
+        port (int): The port to use for the connection.
 
     Returns:
-        bool: True if valid, otherwise False.
+        bytes: The response of _forward_command, or an error message if too many commands are being forwarded.
     """
-    return 0 <= number <= 9223372036854775807
+    if proxy_slots.locked():
+        return b"ER PROXY BUSY\r\n"
+    async with proxy_slots:
+        return await _forward_command(remote_ip, command, port)
 
 
-# --- Proxy functionality ---
-def proxy_command(remote_ip, command, port):
+async def _forward_command(remote_ip, command, port):
     """
-    Attempts to connect to a remote IP on the specified port to forward a command.
+    Sends a command to a remote bank and reads its response.
+    A pooled idle connection to the remote bank is used when there is one, otherwise a new one is opened.
+    The connection goes back to the pool once a complete response has been read.
 
     Args:
         remote_ip (str): The remote IP address.
@@ -71,328 +149,299 @@ def proxy_command(remote_ip, command, port):
         port (int): The port to use for the connection.
 
     Returns:
-        str: The response from the remote server (trimmed), or an error message if the connection fails.
+        bytes: The response line from the remote server (terminated by CRLF), an empty bytes object
+            if the remote server closed a new connection without a response, or an error message
+            if the connection fails. A command is sent again over another connection only if sending it
+            failed; once sent, it is never repeated, since the remote bank may have executed it.
     """
+    key = (remote_ip, port)
+    idle = proxy_pool.get(key)
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        s.settimeout(3)  # Set a timeout of 3 seconds
-        s.connect((remote_ip, port))
-        s.sendall((command + "\r\n").encode("utf-8"))
-        response = ""
-        while not response.endswith("\r\n"):
-            data = s.recv(1024).decode("utf-8")
-            if not data:
-                break
-            response += data
-        s.close()
-        return response.strip()
+        writer = None
+        while idle and writer is None:
+            reader, writer = idle.pop()
+            if not idle:
+                # Only remotes with idle connections keep an entry in the pool.
+                del proxy_pool[key]
+            if writer.is_closing() or reader.at_eof():
+                # The remote closed the idle connection in the meantime: try the next one or a new one.
+                writer.close()
+                writer = None
+                continue
+            try:
+                await _proxy_send(writer, command)
+            except OSError:
+                # The command could not be sent, so it is safe to send it over another connection.
+                writer.close()
+                writer = None
+            except BaseException:
+                writer.close()
+                raise
+        reused = writer is not None
+        if not reused:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(remote_ip, port), PROXY_TIMEOUT)
+            set_socket_options(writer)
+        try:
+            if not reused:
+                await _proxy_send(writer, command)
+            response = await _proxy_read(reader)
+        except BaseException:
+            writer.close()
+            raise
+        if reused and not response:
+            # The command was sent and may have been executed, so it must not be sent again.
+            writer.close()
+            return b"ER PROXY ERROR: connection closed by remote bank\r\n"
+        if response.endswith(b"\r\n") and len(proxy_pool.get(key, ())) < PROXY_POOL_SIZE:
+            proxy_pool.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+        response = response.strip()
+        return response + b"\r\n" if response else b""
+    except asyncio.TimeoutError:
+        return b"ER PROXY ERROR: timed out\r\n"
     except Exception as e:
-        return f"ER PROXY ERROR: {str(e)}"
+        return f"ER PROXY ERROR: {str(e)}\r\n".encode("utf-8")
 
 
 # --- Bank command implementations ---
-class BaseCommand:
-    """
-    Base class for all bank commands.
-    """
-    command_code = ""
+# Every command is a plain function called as fn(args, raw_command, client_ip, bank, logger, proxy_port):
+#   args (list): List of command arguments.
+#   raw_command (str): The original command string, used for logging and proxying.
+#   client_ip (str): IP address of the client issuing the command.
+#   bank (Bank): The Bank instance.
+#   logger (Logger): The Logger instance.
+#   proxy_port (int): Port to use for proxying commands.
+# It returns the response line as bytes terminated by CRLF, or raises CommandError.
+# A command forwarded to another bank returns the proxy_command coroutine instead, to be awaited by the caller.
 
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the command.
+ACCOUNT_AMOUNT_ERROR = "ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT."
+ACCOUNT_FORMAT_ERROR = "THE ACCOUNT NUMBER FORMAT IS NOT CORRECT."
 
-        Args:
-            args (list): List of command arguments.
-            client_ip (str): IP address of the client issuing the command.
-            bank (Bank): The Bank instance.
-            logger (Logger): The Logger instance.
-            proxy_port (int): Port to use for proxying commands.
 
-        Returns:
-            str: The result of executing the command.
+def _parse_account(account_info, bank, format_error):
+    """
+    Parses and validates an account argument in the format "<account_number>/<bank_code>".
 
-        Raises:
-            NotImplementedError: Must be overridden by subclasses.
-        """
-        raise NotImplementedError()
+    Args:
+        account_info (str): The account argument.
+        bank (Bank): The local Bank instance.
+        format_error (str): The error message used if the argument is malformed.
 
+    Returns:
+        tuple: The account number (int) and the code of the remote bank holding the account (str),
+            or None in its place if the account belongs to the local bank.
+
+    Raises:
+        CommandError: If the argument is not in the correct format or the bank code is not an IP address.
+    """
+    local_suffix = bank.local_suffix
+    if account_info.endswith(local_suffix):
+        # Local accounts (the common case) are recognized without splitting the argument.
+        account_str = account_info[:-len(local_suffix)]
+        remote_bank = None
+    else:
+        # A single partition scan splits off the bank code; anything after the first "/" belongs to it.
+        account_str, sep, remote_bank = account_info.partition("/")
+        if not sep or not validate_ip(remote_bank):
+            raise CommandError(format_error)
+    if not (account_str.isascii() and account_str.isdigit()):
+        raise CommandError(format_error)
+    account_number = int(account_str)
+    if not FIRST_ACCOUNT <= account_number <= LAST_ACCOUNT:
+        raise CommandError(format_error)
+    return account_number, remote_bank
+
+
+def _parse_amount(amount_str, format_error):
+    """
+    Parses and validates an amount argument.
 
-class HELPCommand(BaseCommand):
-    """
-    Provides a help message listing available commands.
-    """
-    command_code = "HELP"
+    Args:
+        amount_str (str): The amount argument.
+        format_error (str): The error message used if the argument is malformed.
 
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Returns a help message with available commands.
+    Returns:
+        int: The amount.
 
-        Returns:
-            str: A help message.
-        """
-        help_message = (
-            "Available Commands:\r\n"
-            "BC - returns bank code\r\n"
-            "AC - creates an account and returns its number\r\n"
-            "AD - adds money to account\r\n"
-            "AW - withdraws money from account\r\n"
-            "AB - returns account balance\r\n"
-            "AR - deletes account if empty\r\n"
-            "BA - returns bank value\r\n"
-            "BN - returns number of clients in bank\r\n"
-        )
-        return help_message
+    Raises:
+        CommandError: If the argument is not a valid amount.
+    """
+    if not AMOUNT_RE.match(amount_str):
+        raise CommandError(format_error)
+    amount = int(amount_str)
+    if amount > MAX_BALANCE:
+        raise CommandError(format_error)
+    return amount
 
 
-class BCCommand(BaseCommand):
-    """
-    Returns the bank code.
+def _cmd_help(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    command_code = "BC"
+    Returns a help message with available commands.
 
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the BC command.
-
-        Returns:
-            str: Bank code in the format "BC <bank_code>".
-        """
-        if len(args) != 1:
-            raise CommandError("INVALID NUMBER OF ARGUMENTS FOR BC")
-        logger.log("INFO", client_ip, " ".join(args))
-        return f"BC {bank.bank_code}"
+    Returns:
+        bytes: A help message.
+    """
+    return HELP_BYTES
 
 
-class ACCommand(BaseCommand):
+def _cmd_bc(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    Creates a new account and returns its number.
-    """
-    command_code = "AC"
-
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the AC command.
+    Executes the BC command.
 
-        Returns:
-            str: The new account number and bank code in the format "AC <account_number>/<bank_code>".
-        """
-        if len(args) != 1:
-            raise CommandError("INVALID NUMBER OF ARGUMENTS FOR AC")
-        try:
-            account_number = bank.create_account()
-        except Exception:
-            raise CommandError("OUR BANK DOES NOT ALLOW NEW ACCOUNT CREATION.")
-        logger.log("INFO", client_ip, " ".join(args))
-        return f"AC {account_number}/{bank.bank_code}"
+    Returns:
+        bytes: Bank code in the format "BC <bank_code>".
+    """
+    if len(args) != 1:
+        raise CommandError("INVALID NUMBER OF ARGUMENTS FOR BC")
+    logger.log("INFO", client_ip, raw_command)
+    return bank.bc_response
 
 
-class ADCommand(BaseCommand):
+def _cmd_ac(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    Adds money to an account.
+    Executes the AC command, which creates a new account.
+
+    Returns:
+        bytes: The new account number and bank code in the format "AC <account_number>/<bank_code>".
     """
-    command_code = "AD"
+    if len(args) != 1:
+        raise CommandError("INVALID NUMBER OF ARGUMENTS FOR AC")
+    try:
+        account_number = bank.create_account()
+    except Exception:
+        raise CommandError("OUR BANK DOES NOT ALLOW NEW ACCOUNT CREATION.")
+    logger.log("INFO", client_ip, raw_command)
+    return b"AC %d/%s\r\n" % (account_number, bank.bank_code_bytes)
 
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the AD command. If the bank code in the account info does not match the local bank,
-        the command is proxied to the remote node.
 
-        Returns:
-            str: "AD" if successful or the proxied response.
-        """
-        if len(args) != 3:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        account_info = args[1]
-        amount_str = args[2]
-        if "/" not in account_info:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        account_num_str, account_bank = account_info.split("/")
-        if account_bank != bank.bank_code:
-            command_str = " ".join(args)
-            return proxy_command(account_bank, command_str, proxy_port)
-        try:
-            account_number = int(account_num_str)
-        except ValueError:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        if not validate_account_number(account_number):
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        try:
-            amount = int(amount_str)
-        except ValueError:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        if not validate_number(amount):
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
+def _cmd_ad(args, raw_command, client_ip, bank, logger, proxy_port):
+    """
+    Executes the AD command, which adds money to an account. If the bank code in the account info
+    does not match the local bank, the command is proxied to the remote node.
+
+    Returns:
+        bytes: "AD" if successful or the proxied response.
+    """
+    if len(args) != 3:
+        raise CommandError(ACCOUNT_AMOUNT_ERROR)
+    account_number, remote_bank = _parse_account(args[1], bank, ACCOUNT_AMOUNT_ERROR)
+    if remote_bank:
+        return proxy_command(remote_bank, raw_command, proxy_port)
+    amount = _parse_amount(args[2], ACCOUNT_AMOUNT_ERROR)
+    try:
         bank.deposit(account_number, amount)
-        logger.log("INFO", client_ip, " ".join(args))
-        return "AD"
+    except Exception:
+        raise CommandError(ACCOUNT_AMOUNT_ERROR)
+    logger.log("INFO", client_ip, raw_command)
+    return AD_OK
 
 
-class AWCommand(BaseCommand):
-    """
-    Withdraws money from an account.
+def _cmd_aw(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    command_code = "AW"
+    Executes the AW command, which withdraws money from an account. If the bank code does not match
+    the local bank, the command is proxied.
 
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the AW command. If the bank code does not match the local bank,
-        the command is proxied.
-
-        Returns:
-            str: "AW" if successful or the proxied response.
-        """
-        if len(args) != 3:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        account_info = args[1]
-        amount_str = args[2]
-        if "/" not in account_info:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        account_num_str, account_bank = account_info.split("/")
-        if account_bank != bank.bank_code:
-            command_str = " ".join(args)
-            return proxy_command(account_bank, command_str, proxy_port)
-        try:
-            account_number = int(account_num_str)
-        except ValueError:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        if not validate_account_number(account_number):
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        try:
-            amount = int(amount_str)
-        except ValueError:
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        if not validate_number(amount):
-            raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        try:
-            bank.withdraw(account_number, amount)
-        except Exception as e:
-            if str(e).upper() == "INSUFFICIENT FUNDS":
-                raise CommandError("INSUFFICIENT FUNDS.")
-            else:
-                raise CommandError("ACCOUNT NUMBER AND AMOUNT ARE NOT IN THE CORRECT FORMAT.")
-        logger.log("INFO", client_ip, " ".join(args))
-        return "AW"
+    Returns:
+        bytes: "AW" if successful or the proxied response.
+    """
+    if len(args) != 3:
+        raise CommandError(ACCOUNT_AMOUNT_ERROR)
+    account_number, remote_bank = _parse_account(args[1], bank, ACCOUNT_AMOUNT_ERROR)
+    if remote_bank:
+        return proxy_command(remote_bank, raw_command, proxy_port)
+    amount = _parse_amount(args[2], ACCOUNT_AMOUNT_ERROR)
+    try:
+        bank.withdraw(account_number, amount)
+    except Exception as e:
+        if str(e).upper() == "INSUFFICIENT FUNDS":
+            raise CommandError("INSUFFICIENT FUNDS.")
+        else:
+            raise CommandError(ACCOUNT_AMOUNT_ERROR)
+    logger.log("INFO", client_ip, raw_command)
+    return AW_OK
 
 
-class ABCommand(BaseCommand):
+def _cmd_ab(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    Returns the balance of an account.
-    """
-    command_code = "AB"
-
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the AB command. If the bank code does not match, proxies the command.
+    Executes the AB command, which returns the balance of an account. If the bank code does not match,
+    proxies the command.
 
-        Returns:
-            str: The account balance in the format "AB <balance>" or the proxied response.
-        """
-        if len(args) != 2:
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        account_info = args[1]
-        if "/" not in account_info:
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        account_num_str, account_bank = account_info.split("/")
-        if account_bank != bank.bank_code:
-            command_str = " ".join(args)
-            return proxy_command(account_bank, command_str, proxy_port)
-        try:
-            account_number = int(account_num_str)
-        except ValueError:
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        if not validate_account_number(account_number):
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
+    Returns:
+        bytes: The account balance in the format "AB <balance>" or the proxied response.
+    """
+    if len(args) != 2:
+        raise CommandError(ACCOUNT_FORMAT_ERROR)
+    account_number, remote_bank = _parse_account(args[1], bank, ACCOUNT_FORMAT_ERROR)
+    if remote_bank:
+        return proxy_command(remote_bank, raw_command, proxy_port)
+    try:
         balance = bank.get_balance(account_number)
-        logger.log("INFO", client_ip, " ".join(args))
-        return f"AB {balance}"
+    except Exception:
+        raise CommandError(ACCOUNT_FORMAT_ERROR)
+    logger.log("INFO", client_ip, raw_command)
+    return b"AB %d\r\n" % balance
 
 
-class ARCommand(BaseCommand):
-    """
-    Deletes an account if its balance is zero.
+def _cmd_ar(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    command_code = "AR"
+    Executes the AR command, which deletes an account if its balance is zero. Deletion is only allowed locally.
 
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the AR command. Deletion is only allowed locally.
-
-        Returns:
-            str: "AR" if successful.
-        """
-        if len(args) != 2:
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        account_info = args[1]
-        if "/" not in account_info:
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        account_num_str, account_bank = account_info.split("/")
-        if account_bank != bank.bank_code:
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        try:
-            account_number = int(account_num_str)
-        except ValueError:
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        if not validate_account_number(account_number):
-            raise CommandError("THE ACCOUNT NUMBER FORMAT IS NOT CORRECT.")
-        try:
-            bank.remove_account(account_number)
-        except Exception:
-            raise CommandError("CANNOT DELETE AN ACCOUNT THAT HAS FUNDS.")
-        logger.log("INFO", client_ip, " ".join(args))
-        return "AR"
+    Returns:
+        bytes: "AR" if successful.
+    """
+    if len(args) != 2:
+        raise CommandError(ACCOUNT_FORMAT_ERROR)
+    account_number, remote_bank = _parse_account(args[1], bank, ACCOUNT_FORMAT_ERROR)
+    if remote_bank:
+        raise CommandError(ACCOUNT_FORMAT_ERROR)
+    try:
+        bank.remove_account(account_number)
+    except Exception:
+        raise CommandError("CANNOT DELETE AN ACCOUNT THAT HAS FUNDS.")
+    logger.log("INFO", client_ip, raw_command)
+    return AR_OK
 
 
-class BACommand(BaseCommand):
+def _cmd_ba(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    Returns the total funds in the bank.
-    """
-    command_code = "BA"
-
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the BA command.
+    Executes the BA command, which returns the total funds in the bank.
 
-        Returns:
-            str: The bank value in the format "BA <total>".
-        """
-        if len(args) != 1:
-            raise CommandError("INVALID NUMBER OF ARGUMENTS FOR BA")
-        total = bank.get_total_amount()
-        logger.log("INFO", client_ip, " ".join(args))
-        return f"BA {total}"
+    Returns:
+        bytes: The bank value in the format "BA <total>".
+    """
+    if len(args) != 1:
+        raise CommandError("INVALID NUMBER OF ARGUMENTS FOR BA")
+    total = bank.get_total_amount()
+    logger.log("INFO", client_ip, raw_command)
+    return b"BA %d\r\n" % total
 
 
-class BNCommand(BaseCommand):
-    """
-    Returns the number of active accounts in the bank.
+def _cmd_bn(args, raw_command, client_ip, bank, logger, proxy_port):
     """
-    command_code = "BN"
-
-    def execute(self, args, client_ip, bank, logger, proxy_port):
-        """
-        Executes the BN command.
+    Executes the BN command, which returns the number of active accounts in the bank.
 
-        Returns:
-            str: The number of clients in the format "BN <count>".
-        """
-        if len(args) != 1:
-            raise CommandError("INVALID NUMBER OF ARGUMENTS FOR BN")
-        count = bank.get_client_count()
-        logger.log("INFO", client_ip, " ".join(args))
-        return f"BN {count}"
+    Returns:
+        bytes: The number of clients in the format "BN <count>".
+    """
+    if len(args) != 1:
+        raise CommandError("INVALID NUMBER OF ARGUMENTS FOR BN")
+    count = bank.get_client_count()
+    logger.log("INFO", client_ip, raw_command)
+    return b"BN %d\r\n" % count
 
 
 # --- Command registry ---
 COMMANDS = {
-    "HELP": HELPCommand(),
-    "BC": BCCommand(),
-    "AC": ACCommand(),
-    "AD": ADCommand(),
-    "AW": AWCommand(),
-    "AB": ABCommand(),
-    "AR": ARCommand(),
-    "BA": BACommand(),
-    "BN": BNCommand(),
+    "HELP": _cmd_help,
+    "BC": _cmd_bc,
+    "AC": _cmd_ac,
+    "AD": _cmd_ad,
+    "AW": _cmd_aw,
+    "AB": _cmd_ab,
+    "AR": _cmd_ar,
+    "BA": _cmd_ba,
+    "BN": _cmd_bn,
 }
 
 
@@ -408,29 +457,35 @@ def handle_bank_command(command, client_ip, bank, logger, proxy_port):
         proxy_port (int): The port to use for proxying commands.
 
     Returns:
-        str: The response from executing the command.
+        bytes: The response line from executing the command, terminated by CRLF, or a coroutine
+            producing the response if the command is forwarded to another bank.
     """
-    parts = command.split()
+    # No command takes more than two arguments, so splitting stops after the third token; any further
+    # arguments end up in a fourth part that still fails the argument count checks.
+    parts = command.split(None, 3)
     if not parts:
         logger.log("ER", client_ip, command, "INVALID COMMAND")
-        return "ER INVALID COMMAND"
+        return b"ER INVALID COMMAND\r\n"
     cmd_key = parts[0]
-    cmd_instance = COMMANDS.get(cmd_key)
-    if not cmd_instance:
+    cmd_function = COMMANDS.get(cmd_key)
+    if not cmd_function:
         logger.log("ER", client_ip, command, "UNKNOWN COMMAND")
-        return "ER UNKNOWN COMMAND"
+        return b"ER UNKNOWN COMMAND\r\n"
     try:
-        result = cmd_instance.execute(parts, client_ip, bank, logger, proxy_port)
-        return result
+        return cmd_function(parts, command, client_ip, bank, logger, proxy_port)
     except CommandError as ce:
         error_message = str(ce)
         logger.log("ER", client_ip, command, error_message)
-        return f"ER {error_message}"
+        return f"ER {error_message}\r\n".encode("utf-8")
 
 
-def process_bank_command(command, client_ip, bank, logger, response_timeout, proxy_port):
+async def process_bank_command(command, client_ip, bank, logger, response_timeout, proxy_port):
     """
-    Processes a bank command using a separate thread and applies a timeout.
+    Processes a bank command and applies a timeout to forwarded commands.
+
+    Local commands only work with in-memory data, so they run directly on the event loop without
+    a hop to a worker thread. A command forwarded to another bank is awaited with the timeout applied,
+    which leaves the event loop free for other clients in the meantime.
 
     Args:
         command (str): The command string.
@@ -441,25 +496,26 @@ def process_bank_command(command, client_ip, bank, logger, response_timeout, pro
         proxy_port (int): The port to use for proxying commands.
 
     Returns:
-        str: The result of command execution, or an error message if a timeout occurs.
+        bytes: The response line of the command, or an error message if a timeout occurs.
     """
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(handle_bank_command, command, client_ip, bank, logger, proxy_port)
+    response = handle_bank_command(command, client_ip, bank, logger, proxy_port)
+    if asyncio.iscoroutine(response):
         try:
-            result = future.result(timeout=response_timeout)
-            bank.save_data()  # Save data after each operation.
-            return result
-        except concurrent.futures.TimeoutError:
+            response = await asyncio.wait_for(response, timeout=response_timeout)
+        except asyncio.TimeoutError:
             logger.log("ER", client_ip, command, "TIMEOUT PROCESSING COMMAND")
-            return "ER TIMEOUT PROCESSING COMMAND"
+            return b"ER TIMEOUT PROCESSING COMMAND\r\n"
+    return response
 
 
 class BankServer:
     """
     Handles client connections and processes bank commands.
+
+    Client connections are served as asyncio tasks on a single event loop instead of one thread per client.
     """
 
-    def __init__(self, bank, logger, response_timeout, port):
+    def __init__(self, bank, logger, response_timeout, port, debug=False):
         """
         Initializes the BankServer.
 
@@ -468,58 +524,88 @@ class BankServer:
             logger (Logger): The Logger instance.
             response_timeout (int): Timeout in seconds for command processing.
             port (int): The default port used for proxying commands (must be consistent across nodes).
+            debug (bool): If True, every received command is printed to the console.
         """
         self.bank = bank
         self.logger = logger
         self.response_timeout = response_timeout
         self.port = port
-        self.clients = []
+        self.debug = debug
+        self.clients = {}  # writers of the connected clients, keyed by id(writer)
 
-    def process_command(self, command, client_socket):
+    async def process_command(self, command, client_ip):
         """
         Processes a command received from a client.
 
         Args:
             command (str): The raw command string.
-            client_socket (socket.socket): The client's socket.
+            client_ip (str): The IP address of the client.
 
         Returns:
-            str: The response to be sent back to the client.
+            bytes: The response to be sent back to the client.
         """
-        try:
-            client_ip = client_socket.getpeername()[0]
-        except Exception:
-            client_ip = "0.0.0.0"
-        return process_bank_command(command, client_ip, self.bank, self.logger, self.response_timeout, self.port)
+        return await process_bank_command(command, client_ip, self.bank, self.logger, self.response_timeout,
+                                          self.port)
 
-    def handle_client(self, client_socket):
+    async def handle_client(self, reader, writer):
         """
         Handles communication with a connected client. Receives data, processes commands,
         and sends back responses.
 
         Args:
-            client_socket (socket.socket): The socket for the connected client.
+            reader (asyncio.StreamReader): The reader of the client's connection.
+            writer (asyncio.StreamWriter): The writer of the client's connection.
         """
-        self.clients.append(client_socket)
-        buffer = ""
+        # The peer address does not change, so look it up once per connection.
+        try:
+            client_ip = writer.get_extra_info("peername")[0]
+        except Exception:
+            client_ip = "0.0.0.0"
+        set_socket_options(writer)
+        self.clients[id(writer)] = writer
+        buffer = bytearray()
         while True:
             try:
-                data = client_socket.recv(1024).decode("utf-8")
+                data = await reader.read(RECV_SIZE)
                 if not data:
                     break
-                buffer += data
-                while "\r\n" in buffer:
-                    command, buffer = buffer.split("\r\n", 1)
-                    command = command.strip().upper()  # Convert input to uppercase.
-                    print(f"RECEIVED COMMAND: {command}")
-                    response = self.process_command(command, client_socket)
+                if buffer:
+                    # Complete the unterminated command left over from the previous read.
+                    buffer += data
+                    data = buffer
+                # Process every complete command in the data; only the command lines are decoded.
+                start = 0
+                while True:
+                    end = data.find(b"\r\n", start)
+                    if end == -1:
+                        break
+                    command = data[start:end].decode("utf-8").strip().upper()  # Convert input to uppercase.
+                    start = end + 2
+                    if self.debug:
+                        print(f"RECEIVED COMMAND: {command}")
+                    response = await self.process_command(command, client_ip)
                     if response:
-                        client_socket.send((response + "\r\n").encode("utf-8"))
-            except ConnectionResetError:
+                        writer.write(response)
+                # Keep only the unterminated rest; data that ends with a complete command is not copied at all.
+                if data is buffer:
+                    del buffer[:start]
+                elif start < len(data):
+                    buffer += memoryview(data)[start:]
+                await writer.drain()
+                if len(buffer) > MAX_COMMAND_LENGTH:
+                    self.logger.log("ER", client_ip, "", "COMMAND TOO LONG")
+                    writer.write(b"ER COMMAND TOO LONG\r\n")
+                    await writer.drain()
+                    break
+            except (ConnectionResetError, asyncio.CancelledError):
+                # The client disconnected, or the server is shutting down.
                 break
             except Exception as e:
-                self.logger.log("ER", "UNKNOWN", command if 'command' in locals() else "", str(e))
+                self.logger.log("ER", client_ip, command if 'command' in locals() else "", str(e))
                 break
-        if client_socket in self.clients:
-            self.clients.remove(client_socket)
-        client_socket.close()
+        self.clients.pop(id(writer), None)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
@@ -1,34 +1,48 @@
 """
-This module defines the Logger class which logs events to daily JSON files.
+This module defines the Logger class which logs events to daily JSON Lines files.
 Each log entry includes a timestamp (with minute precision), the client's IP, the command, and an optional error message.
 """
 
 import os
 import json
 import datetime
+import time
+import threading
+import queue
 
 
 class Logger:
     """
-    Logger class for writing log entries to a JSON file.
+    Logger class for writing log entries to a JSON Lines file.
 
-    Each log file is named with the current date (DD,MM,YYYY.json) and stores a JSON array of log entries.
+    Each log file is named with the current date (DD,MM,YYYY.json) and stores one JSON object per line.
+    log() only puts the entry on a queue; a background writer thread serializes the entries and appends
+    them to the file of the current day, which is kept open and reopened only when the date changes.
     """
 
     def __init__(self, log_dir="logs"):
         """
-        Initializes the Logger instance.
+        Initializes the Logger instance and starts the writer thread.
 
         Args:
             log_dir (str): Directory where log files will be stored.
         """
         self.log_dir = log_dir
+        self.lock = threading.Lock()  # guards the open file between the writer thread and close()
+        self.current_date = None  # date of the currently open log file
+        self.current_file = None  # open handle of the current day's log file
+        self.queue = queue.Queue()  # (date, entry) pairs waiting to be written
+        self._minute = -1  # minute (since the epoch) the cached timestamp belongs to
+        self._cached = None  # (timestamp, date) of that minute
+        self.write_error = None  # message of the last failed write, reported only once
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
+        self.writer_thread = threading.Thread(target=self._write_entries, daemon=True)
+        self.writer_thread.start()
 
     def log(self, level, client_ip, command, error_message=None):
         """
-        Writes a log entry to the daily log file.
+        Queues a log entry for the daily log file.
 
         Args:
             level (str): The log level (e.g., "INFO", "ER").
@@ -36,10 +50,13 @@ class Logger:
             command (str): The command string.
             error_message (str, optional): An optional error message.
         """
-        now = datetime.datetime.now()
-        timestamp = now.strftime("%Y-%m-%dT%H:%M")
-        date_str = now.strftime("%d,%m,%Y")
-        log_file = os.path.join(self.log_dir, f"{date_str}.json")
+        minute = int(time.time() // 60)
+        if minute != self._minute:
+            # Timestamps have minute precision, so they are only formatted once per minute.
+            now = datetime.datetime.now()
+            self._cached = (now.strftime("%Y-%m-%dT%H:%M"), now.date())
+            self._minute = minute
+        timestamp, date = self._cached
         log_entry = {
             "timestamp": timestamp,
             "level": level,
@@ -48,19 +65,78 @@ class Logger:
         }
         if error_message:
             log_entry["error"] = error_message
+        self.queue.put((date, log_entry))
 
-        # Load existing logs as a JSON array, or create an empty array.
-        if os.path.exists(log_file):
+    def _write_entries(self):
+        """
+        Writer thread loop: appends queued entries to the log file of their day.
+        The file is flushed whenever the queue runs empty, so a burst of entries is written at once.
+        """
+        while True:
+            date, log_entry = self.queue.get()
             try:
-                with open(log_file, "r", encoding="utf-8") as f:
-                    logs = json.load(f)
-                    if not isinstance(logs, list):
-                        logs = []
-            except Exception:
-                logs = []
-        else:
-            logs = []
+                with self.lock:
+                    if date != self.current_date:
+                        # The day changed (or this is the first entry): switch to the new day's file.
+                        if self.current_file:
+                            self.current_file.close()
+                        # If opening the new file fails, the next entry tries again.
+                        self.current_file = None
+                        self.current_date = None
+                        log_file = os.path.join(self.log_dir, f"{date.strftime('%d,%m,%Y')}.json")
+                        self.current_file = open(log_file, "a", encoding="utf-8")
+                        self.current_date = date
+                    self.current_file.write(json.dumps(log_entry) + "\n")
+                    if self.queue.empty():
+                        self.current_file.flush()
+                self.write_error = None
+            except Exception as e:
+                # Entries that cannot be written are dropped. The error is reported once, not for every entry.
+                if str(e) != self.write_error:
+                    self.write_error = str(e)
+                    print(f"Error writing log entries: {e}")
+            finally:
+                self.queue.task_done()
 
-        logs.append(log_entry)
-        with open(log_file, "w", encoding="utf-8") as f:
-            json.dump(logs, f, indent=2)
+    def flush(self):
+        """
+        Blocks until every queued entry has been written to the log file.
+        """
+        self.queue.join()
+        with self.lock:
+            if self.current_file:
+                self.current_file.flush()
+
+    def close(self):
+        """
+        Writes the remaining queued entries and closes the currently open log file.
+        """
+        self.flush()
+        with self.lock:
+            if self.current_file:
+                self.current_file.close()
+            self.current_file = None
+            self.current_date = None
+
+    def read_logs(self, date=None):
+        """
+        Reads the log entries of a given day.
+
+        Args:
+            date (datetime.date, optional): The day to read. Defaults to today.
+
+        Yields:
+            dict: The parsed log entries in the order they were written. Malformed lines are skipped.
+        """
+        if date is None:
+            date = datetime.date.today()
+        self.flush()
+        log_file = os.path.join(self.log_dir, f"{date.strftime('%d,%m,%Y')}.json")
+        if not os.path.exists(log_file):
+            return
+        with open(log_file, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
@@ -1,18 +1,20 @@
 """
 This module loads the configuration, initializes the bank server,
-and listens for client connections. On shutdown (KeyboardInterrupt), it saves
+and listens for client connections on an asyncio event loop. On shutdown (KeyboardInterrupt), it saves
 the current account data.
 """
 
+import asyncio
 import socket
-import threading
 import sys
 import json
 import os
-from bank import Bank
+from bank import Bank, SAVE_INTERVAL
 from logger import Logger
 from command_handler import BankServer
 
+LISTEN_BACKLOG = 1024  # pending connections the OS queues before the server accepts them
+
 
 def load_config():
     """
@@ -35,12 +37,28 @@ def load_config():
     return config
 
 
+async def serve(bank_server, bind_ip, port, bank_code):
+    """
+    Starts the asyncio server and serves client connections until cancelled.
+
+    Args:
+        bank_server (BankServer): The BankServer handling the client connections.
+        bind_ip (str): The IP address to listen on.
+        port (int): The port to listen on.
+        bank_code (str): The bank code, shown in the startup message.
+    """
+    server = await asyncio.start_server(bank_server.handle_client, bind_ip, port, backlog=LISTEN_BACKLOG)
+    print(f"Server listening on {bind_ip}:{port} with bank code {bank_code}")
+    async with server:
+        await server.serve_forever()
+
+
 def main():
     """
     Main entry point for the bank server application.
 
     Loads the configuration, initializes the bank, logger, and bank server,
-    sets up the server socket, and accepts incoming client connections.
+    and serves incoming client connections on an asyncio event loop.
     On KeyboardInterrupt, account data is saved and the server shuts down.
     """
     config = load_config()
@@ -50,6 +68,12 @@ def main():
         print("PORT MUST BE IN THE RANGE 65525 - 65535")
         sys.exit(1)
 
+    save_interval = config.get("save_interval", SAVE_INTERVAL)
+    is_number = isinstance(save_interval, (int, float)) and not isinstance(save_interval, bool)
+    if not is_number or not 0 < save_interval < float("inf"):
+        print("SAVE INTERVAL MUST BE A POSITIVE NUMBER OF SECONDS")
+        sys.exit(1)
+
     # Server listens on all interfaces.
     bind_ip = "0.0.0.0"
     # Automatically obtain local IP address as bank code.
@@ -59,25 +83,23 @@ def main():
     # bank_code = config.get("ip", bank_code)
 
     bank = Bank(bank_code)
-    # Load saved account data if available.
-    bank.load_data()
+    # Load saved account data if available. A file that cannot be loaded must not be overwritten.
+    try:
+        bank.load_data()
+    except ValueError as e:
+        print(f"ACCOUNT DATA COULD NOT BE LOADED: {e}")
+        sys.exit(1)
+    # Save changed account data in the background.
+    bank.start_autosave(save_interval)
     logger = Logger()
-    bank_server = BankServer(bank, logger, response_timeout=5, port=port)
-
-    server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    server_socket.bind((bind_ip, port))
-    server_socket.listen(5)
-    print(f"Server listening on {bind_ip}:{port} with bank code {bank_code}")
+    bank_server = BankServer(bank, logger, response_timeout=5, port=port, debug=config.get("debug", False))
 
     try:
-        while True:
-            client_socket, client_address = server_socket.accept()
-            threading.Thread(target=bank_server.handle_client, args=(client_socket,), daemon=True).start()
+        asyncio.run(serve(bank_server, bind_ip, port, bank_code))
     except KeyboardInterrupt:
         print("\nShutting down server. Saving account data...")
         bank.save_data()
-        server_socket.close()
+        logger.close()
         sys.exit(0)
 
 